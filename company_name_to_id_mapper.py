@@ -95,9 +95,19 @@ import json
 import logging
 import sys
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from collections import defaultdict
 
+# orjson decodes the large company-list responses faster than the
+# stdlib json module; fall back silently when it isn't installed.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
 # Freshdesk API Configuration
 # TODO: Move these to environment variables for security
 API_KEY = "5TMgbcZdRFY70hSpEdj"  # Replace with your actual API key
@@ -107,6 +117,9 @@ DOMAIN = "benchmarkeducationcompany.freshdesk.com"  # Replace with your domain
 OUTPUT_FILENAME = "company_ids.xlsx"
 LOG_FILENAME = "company_lookup.log"
 REQUEST_TIMEOUT = 30  # 30 seconds timeout for API requests
+COMPANIES_PER_PAGE = 100  # Maximum page size the API allows
+CONCURRENT_PAGE_FETCHES = 8  # Pages fetched in parallel per wave
+COMPANIES_CACHE_FILENAME = "companies_cache.json"  # Company list + validating ETag
 
 # Configure logging
 logging.basicConfig(
@@ -187,7 +200,7 @@ def make_api_request(url):
         response = requests.get(url, auth=(API_KEY, 'X'), timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
-            return response.json()
+            return json_loads(response.content)
         elif response.status_code == 404:
             logging.warning(f"Resource not found: {url}")
             return None
@@ -271,6 +284,32 @@ def normalize_company_name(name):
 
     return name
 
+def load_companies_cache():
+    """
+    Load the cached company list and the ETag that validated it.
+
+    Returns:
+        tuple: (etag, companies) from disk, or (None, None) if the
+               cache is missing or unreadable
+    """
+    try:
+        with open(COMPANIES_CACHE_FILENAME, 'rb') as cache_file:
+            cached = json_loads(cache_file.read())
+        return cached.get('etag'), cached.get('companies')
+    except (OSError, ValueError):
+        return None, None
+
+def save_companies_cache(etag, companies):
+    """Persist the company list alongside the ETag that validated it."""
+    if not etag or not companies:
+        return
+    try:
+        with open(COMPANIES_CACHE_FILENAME, 'w', encoding='utf-8') as cache_file:
+            json.dump({'etag': etag, 'companies': companies}, cache_file)
+        logging.info(f"Cached {len(companies)} companies with ETag {etag}")
+    except OSError as e:
+        logging.warning(f"Could not write companies cache: {e}")
+
 def get_all_companies():
     """
     Retrieve all companies from Freshdesk for local matching.
@@ -281,62 +320,107 @@ def get_all_companies():
     Note:
         - Fetches all companies to avoid repeated API calls
         - Uses pagination to handle large datasets
+        - A conditional request (If-None-Match) against page 1 skips
+          the whole paginated walk when nothing changed since the
+          cached run
     """
     base_url = f"https://{DOMAIN}/api/v2/companies"
-    all_companies = []
-    page = 1
 
-    logging.info("Fetching all companies for local matching...")
-    print("Fetching all companies for local matching..."
-    while True:
+    # Revalidate the cache first: a 304 costs no body transfer and
+    # replaces the entire multi-page walk.
+    cached_etag, cached_companies = load_companies_cache()
+    if cached_etag and cached_companies:
         try:
-            # Make API request for current page
-            response = requests.get(
-                f"{base_url}?page={page}&per_page=100",
+            probe = requests.get(
+                f"{base_url}?page=1&per_page={COMPANIES_PER_PAGE}",
                 auth=(API_KEY, 'X'),
+                headers={'If-None-Match': cached_etag},
                 timeout=REQUEST_TIMEOUT
             )
-        
-        if response.status_code == 200:
-                # Success - parse response data
-                data = response.json()
-
-                if not data:
-                    # No more data available
-                    logging.info(f"Completed fetching all companies. Total pages: {page - 1}")
-                    break
-
-                # Add this page of companies to our collection
-                all_companies.extend(data)
-                logging.info(f"Fetched page {page} ({len(data)} companies)")
-                print(f"  Page {page}: {len(data)} companies retrieved")
-
-                page += 1
+            if probe.status_code == 304:
+                logging.info(f"Companies unchanged (ETag match); using {len(cached_companies)} cached companies")
+                print(f"✓ Companies unchanged; using {len(cached_companies)} cached companies")
+                return cached_companies
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"Conditional companies request failed, falling back to full fetch: {e}")
 
+    logging.info("Fetching all companies for local matching...")
+    print("Fetching all companies for local matching...")
+
+    # fetch_page stashes the page-1 ETag here so the walk can be
+    # revalidated cheaply next run, and flags any failed page so a
+    # truncated walk is never cached as if it were complete
+    etag_holder = {}
+    error_holder = {}
+
+    def fetch_page(page):
+        """Fetch one page of companies, retrying on rate limits."""
+        while True:
+            try:
+                response = requests.get(
+                    f"{base_url}?page={page}&per_page={COMPANIES_PER_PAGE}",
+                    auth=(API_KEY, 'X'),
+                    timeout=REQUEST_TIMEOUT
+                )
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Network error on page {page}: {e}")
+                print(f"❌ Network error on page {page}: {e}")
+                error_holder['failed'] = True
+                return None
+
+            if response.status_code == 200:
+                if page == 1:
+                    etag_holder['etag'] = response.headers.get('ETag')
+                return json_loads(response.content)
             elif response.status_code == 429:
                 # Rate limit exceeded - retry after delay
                 retry_after = int(response.headers.get('Retry-After', 60))
                 logging.warning(f"Rate limit exceeded on page {page}. Retrying after {retry_after} seconds...")
                 print(f"⏳ Rate limit reached. Waiting {retry_after} seconds...")
                 time.sleep(retry_after)
-                continue  # Retry the same page
-
-        else:
-                # Other error
+            else:
                 logging.error(f"Failed to fetch companies on page {page}. Status: {response.status_code}")
                 logging.error(f"Response: {response.text}")
                 print(f"❌ Failed to fetch page {page}: {response.status_code}")
-                break
+                error_holder['failed'] = True
+                return None
 
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Network error on page {page}: {e}")
-            print(f"❌ Network error on page {page}: {e}")
-            break
+    # Fetch pages in concurrent waves: the page count isn't known up
+    # front, so each wave of CONCURRENT_PAGE_FETCHES pages runs in
+    # parallel and fetching stops at the first short or empty page.
+    all_companies = []
+    next_page = 1
+    done = False
+
+    with ThreadPoolExecutor(max_workers=CONCURRENT_PAGE_FETCHES) as executor:
+        while not done:
+            pages = range(next_page, next_page + CONCURRENT_PAGE_FETCHES)
+            for page, data in zip(pages, executor.map(fetch_page, pages)):
+                if not data:
+                    done = True
+                    break
+
+                all_companies.extend(data)
+                logging.info(f"Fetched page {page} ({len(data)} companies)")
+                print(f"  Page {page}: {len(data)} companies retrieved")
+
+                if len(data) < COMPANIES_PER_PAGE:
+                    done = True
+                    break
+            next_page += CONCURRENT_PAGE_FETCHES
 
     total_companies = len(all_companies)
     logging.info(f"Successfully retrieved {total_companies} companies total")
     print(f"✓ Retrieved {total_companies} companies total")
 
+    # Only cache a clean, complete walk: a list truncated by an error
+    # would revalidate against the still-valid page-1 ETag and stay
+    # wrong until the tenant's companies happened to change
+    if error_holder:
+        logging.warning("Company fetch did not complete; skipping cache update")
+    else:
+        save_companies_cache(etag_holder.get('etag'), all_companies)
+
     return all_companies
 
 def find_company_match(target_name, all_companies):
@@ -452,7 +536,7 @@ def save_results_to_excel(company_data, filename):
         logging.error(error_msg)
         print(f"❌ {error_msg}")
         return False
-        except Exception as e:
+    except Exception as e:
         error_msg = f"Error saving Excel file: {e}"
         logging.error(error_msg)
         print(f"❌ {error_msg}")
@@ -507,7 +591,7 @@ def analyze_results(company_data):
             analysis["confidence_distribution"]["Medium (≥0.7)"] += 1
         elif confidence >= 0.6:
             analysis["confidence_distribution"]["Low (≥0.6)"] += 1
-else:
+        else:
             analysis["confidence_distribution"]["Very Low (<0.6)"] += 1
 
     return analysis
@@ -540,15 +624,15 @@ def main():
             return 1
 
         # Show sample of fetched companies
-        print("
-📋 SAMPLE COMPANIES IN FRESHdesk:"        for i, company in enumerate(all_companies[:5], 1):
+        print("\n📋 SAMPLE COMPANIES IN FRESHDESK:")
+        for i, company in enumerate(all_companies[:5], 1):
             print(f"  {i}. {company.get('name', 'N/A')} (ID: {company.get('id', 'N/A')})")
         if len(all_companies) > 5:
             print(f"  ... and {len(all_companies) - 5} more companies")
 
         # Step 2: Process each company name
-        print("
-Step 2: Searching for company matches..."        company_data = []
+        print("\nStep 2: Searching for company matches...")
+        company_data = []
 
         for i, target_name in enumerate(COMPANY_NAMES, 1):
             print(f"\n  [{i}/{len(COMPANY_NAMES)}] Searching for: '{target_name}'")
@@ -586,25 +670,25 @@ Step 2: Searching for company matches..."        company_data = []
             time.sleep(0.1)
 
         # Step 3: Save results
-        print("
-Step 3: Saving results to Excel..."        if save_results_to_excel(company_data, OUTPUT_FILENAME):
+        print("\nStep 3: Saving results to Excel...")
+        if save_results_to_excel(company_data, OUTPUT_FILENAME):
             # Step 4: Analyze results
-            print("
-Step 4: Analyzing results..."            analysis = analyze_results(company_data)
+            print("\nStep 4: Analyzing results...")
+            analysis = analyze_results(company_data)
 
             # Display analysis results
-            print("
-📊 LOOKUP ANALYSIS:"            print(f"  Total companies searched: {analysis['total_companies']}")
+            print("\n📊 LOOKUP ANALYSIS:")
+            print(f"  Total companies searched: {analysis['total_companies']}")
             print(f"  Companies found: {analysis['found_companies']}")
             print(f"  Companies not found: {analysis['not_found_companies']}")
             print(f"  Companies with errors: {analysis['error_companies']}")
 
-            print("
-🎯 MATCH TYPE DISTRIBUTION:"            for match_type, count in analysis['match_type_distribution'].items():
+            print("\n🎯 MATCH TYPE DISTRIBUTION:")
+            for match_type, count in analysis['match_type_distribution'].items():
                 print(f"  {match_type}: {count}")
 
-            print("
-📈 CONFIDENCE DISTRIBUTION:"            for confidence_range, count in analysis['confidence_distribution'].items():
+            print("\n📈 CONFIDENCE DISTRIBUTION:")
+            for confidence_range, count in analysis['confidence_distribution'].items():
                 print(f"  {confidence_range}: {count}")
 
             if analysis['problematic_companies']:
@@ -615,8 +699,7 @@ Step 4: Analyzing results..."            analysis = analyze_results(company_data
                     print(f"  ... and {len(analysis['problematic_companies']) - 5} more")
 
             # Final summary
-            print("
-" + "=" * 60)
+            print("\n" + "=" * 60)
             print("LOOKUP SUMMARY")
             print("=" * 60)
             print(f"✓ Company lookup completed successfully!")
@@ -14,8 +14,8 @@ REQUIREMENTS:
 - Valid attachment file path
 
 SETUP INSTRUCTIONS:
-1. Replace API_KEY with your actual Freshdesk API key
-2. Replace DOMAIN with your Freshdesk domain (e.g., 'yourcompany.freshdesk.com')
+1. Set FRESHDESK_API_KEY environment variable (or replace the fallback API_KEY)
+2. Set FRESHDESK_DOMAIN environment variable (e.g., 'yourcompany.freshdesk.com')
 3. Update RELATED_TICKET_ID with the ticket to link as a related ticket
 4. Update ATTACHMENT_PATH with the path to your attachment file
 5. Ensure your API key has permissions for ticket and conversation access
@@ -77,33 +77,68 @@ USAGE SCENARIOS:
 """
 
 import requests
+import gzip
 import json
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import threading
 import os
 
+# Use orjson for payload serialization when available (~5-10x faster than
+# stdlib json and returns bytes directly); fall back to the stdlib encoder.
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# requests_toolbelt streams the multipart body and reports bytes sent,
+# so large attachments upload with progress feedback instead of a silent
+# blocking POST. Without it the upload falls back to a one-shot post.
+try:
+    from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:
+    MultipartEncoder = MultipartEncoderMonitor = None
+
 # Freshdesk API Details
-API_KEY = "5TMgbcZdRFY70hSpEdj"
-DOMAIN = "benchmarkeducationcompany.freshdesk.com"
+# Read once from the environment at module load so per-call code never
+# touches os.environ; fall back to the historical hardcoded values.
+API_KEY = os.environ.get("FRESHDESK_API_KEY") or "5TMgbcZdRFY70hSpEdj"
+DOMAIN = os.environ.get("FRESHDESK_DOMAIN") or "benchmarkeducationcompany.freshdesk.com"
 RELATED_TICKET_ID = 115423  # The ticket to which the tracker will be linked
 ATTACHMENT_PATH = r"C:\Downloads\4 (2).png"
 
-# API URL for creating a new tracker ticket
+# API URLs and auth, built once at module load. The notes URL is a
+# %d template so per-call work is a single format op instead of an
+# f-string rebuild.
 create_ticket_url = f"https://{DOMAIN}/api/v2/tickets"
+NOTES_URL = f"https://{DOMAIN}/api/v2/tickets/%d/notes"
+AUTH = (API_KEY, "X")
 
-# Configure logging to both file and console
+# Configure logging through a queue: records are handed to a background
+# QueueListener that owns the file and console handlers, so log I/O never
+# blocks the thread making HTTP calls.
 LOG_FILENAME = 'ticket_attachment_creation.log'
+log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILENAME, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler(LOG_FILENAME, encoding='utf-8')
+file_handler.setFormatter(log_formatter)
+console_handler = logging.StreamHandler(sys.stdout)
+console_handler.setFormatter(log_formatter)
+log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+log_listener.start()
 
 # Headers for authentication
 headers = {
@@ -111,62 +146,64 @@ headers = {
     "Content-Type": "application/json"
 }
 
-# Step 1: Create the tracker ticket (without attachment)
-logging.info("Step 1: Creating tracker ticket...")
-print("Step 1: Creating tracker ticket...")
-ticket_payload = {
-    "description": "This is a tracker ticket linked to another issue.",
-    "subject": "Tracker Ticket for Issue #115423",
-    "email": "sskalamera@benchmarkeducation.com",  # Required to create the ticket
-    "related_ticket_ids": [RELATED_TICKET_ID],  # Must be an array of integers
-    "priority": 1,  # 1 = Low, 2 = Medium, 3 = High, 4 = Urgent
-    "status": 2,  # 2 = Open, 3 = Pending, 4 = Resolved, 5 = Closed
-    "cc_emails": ["skalamera@gmail.com"]  # Must be an array
-}
-
-# Send request to create tracker ticket
-create_response = requests.post(create_ticket_url, auth=(API_KEY, "X"), headers=headers, json=ticket_payload)
-
-# Check if ticket creation was successful
-if create_response.status_code == 201:
-    tracker_ticket = create_response.json()  # Get response as JSON
-    tracker_ticket_id = tracker_ticket["id"]  # Extract new ticket ID
-    print(f"âœ… Tracker ticket created successfully! Ticket ID: {tracker_ticket_id}")
-    logging.info(f"Tracker ticket created successfully! Ticket ID: {tracker_ticket_id}")
-else:
-    error_msg = f"Failed to create tracker ticket: {create_response.status_code}, {create_response.text}"
-    print(f"âŒ {error_msg}")
-    logging.error(error_msg)
-    exit()  # Stop script if creation fails
-
-# Step 2: Update the newly created tracker ticket with the attachment
-logging.info("Step 2: Adding attachment to tracker ticket...")
-print("Step 2: Adding attachment to tracker ticket...")
-update_ticket_url = f"https://{DOMAIN}/api/v2/tickets/{tracker_ticket_id}/notes"
-
-# Open the attachment file
-with open(ATTACHMENT_PATH, "rb") as file:
-    files = {
-        "attachments[]": (ATTACHMENT_PATH.split("\\")[-1], file, "image/png"),
-    }
-
-    # Payload for adding a private note with the attachment
-    update_payload = {
-        "body": "Attaching relevant screenshot to the tracker ticket.",
-        "private": "true"  # Must be string "true" or "false" when using multipart
-    }
-
-    # Send request to update the ticket with the attachment
-    update_response = requests.post(update_ticket_url, auth=(API_KEY, "X"), files=files, data=update_payload)
-
-# Check if update was successful
-if update_response.status_code == 201:
-    print("✅ Attachment added successfully to the tracker ticket!")
-    logging.info("Attachment added successfully to the tracker ticket!")
-else:
-    error_msg = f"Failed to add attachment: {update_response.status_code}, {update_response.text}"
-    print(f"❌ {error_msg}")
-    logging.error(error_msg)
+# Shared HTTP client. With httpx installed, the create and notes calls
+# share one HTTP/2 connection (stream multiplexing plus HPACK compression
+# of the repeated Authorization header); otherwise a requests.Session
+# still gives keep-alive reuse of a single TCP connection.
+try:
+    import httpx
+
+    CLIENT = httpx.Client(http2=True, auth=AUTH,
+                          limits=httpx.Limits(max_connections=10, max_keepalive_connections=10))
+
+    def post_body(url, body, post_headers):
+        """POST a raw (bytes or file-like) body over the shared client."""
+        if not isinstance(body, bytes):
+            body = iter(lambda: body.read(65536), b"")
+        return CLIENT.post(url, content=body, headers=post_headers)
+except ImportError:
+    CLIENT = requests.Session()
+    CLIENT.auth = AUTH
+
+    def post_body(url, body, post_headers):
+        """POST a raw (bytes or file-like) body over the shared session."""
+        return CLIENT.post(url, data=body, headers=post_headers)
+
+# Matches the top-level "id" field in the create-ticket response body.
+# Extracting just the ID avoids deserializing the full ticket object
+# (custom fields, requester, company) only to read one number.
+TICKET_ID_PATTERN = re.compile(rb'"id"\s*:\s*(\d+)')
+
+# Payloads at or above this size are gzip-compressed before sending.
+# Tiny payloads skip compression since the CPU cost outweighs the savings.
+GZIP_MIN_BYTES = 1024
+
+# Report upload progress roughly once per this many bytes so the log
+# isn't flooded on large attachments.
+UPLOAD_REPORT_INTERVAL = 1024 * 1024
+
+# Freshdesk rejects attachments over 20 MB, but only after the whole body
+# has been uploaded. Checking locally first saves the wasted upload.
+MAX_ATTACHMENT_BYTES = 20 * 1024 * 1024
+
+def encode_ticket_payload(ticket_payload):
+    """
+    Serialize the ticket payload for posting, compressing large bodies.
+
+    Freshdesk accepts gzip-encoded request bodies, so payloads of
+    GZIP_MIN_BYTES or more (long descriptions, pasted stack traces) are
+    compressed to reduce bytes on the wire. Small payloads are sent as-is.
+
+    Args:
+        ticket_payload (dict): Ticket fields to serialize
+
+    Returns:
+        tuple: (body bytes, headers dict) ready for requests.post
+    """
+    body = dumps(ticket_payload)
+    if len(body) >= GZIP_MIN_BYTES:
+        return gzip.compress(body), {**headers, "Content-Encoding": "gzip"}
+    return body, headers
 
 def main(ticket_data=None, use_gui=False):
     """Main function with optional GUI mode."""
@@ -220,7 +257,7 @@ def process_ticket_creation_gui(ticket_data):
         return
 
     update_progress("Creating tracker ticket...")
-    ticket_id = create_ticket_with_attachment(ticket_data)
+    ticket_id = create_ticket_with_attachment(ticket_data, progress_callback=update_progress)
 
     if ticket_id:
         update_progress("✅ Ticket with attachment created successfully!")
@@ -355,6 +392,10 @@ def create_gui():
             messagebox.showerror("Error", f"Attachment file not found: {attachment_path_var.get()}")
             return
 
+        if os.path.getsize(attachment_path_var.get()) > MAX_ATTACHMENT_BYTES:
+            messagebox.showerror("Error", "Attachment exceeds Freshdesk's 20 MB limit.")
+            return
+
         # Parse form data
         try:
             related_ticket_id = int(related_ticket_var.get())
@@ -371,7 +412,7 @@ def create_gui():
             'email': email_var.get().strip(),
             'priority': priority,
             'status': status,
-            'cc_emails': [cc_var.get().strip()],
+            'cc_emails': [e.strip() for e in cc_var.get().split(',') if e.strip()],
             'attachment_path': attachment_path_var.get(),
             'attachment_note': attachment_note_text.get('1.0', tk.END).strip()
         }
@@ -410,8 +451,25 @@ def create_gui():
 
     return app
 
-def create_ticket_with_attachment(ticket_data):
-    """Create ticket with attachment - refactored to accept parameters."""
+def create_ticket_with_attachment(ticket_data, progress_callback=None):
+    """Create ticket with attachment - refactored to accept parameters.
+
+    When requests_toolbelt is installed, the attachment uploads as a
+    streamed multipart body and progress_callback (default: logging.info)
+    is invoked with a status message roughly once per megabyte sent.
+    """
+    if progress_callback is None:
+        progress_callback = logging.info
+
+    # Reject oversized attachments before any network traffic: Freshdesk
+    # would only 4xx after the full body had been uploaded.
+    attachment_size = os.path.getsize(ticket_data['attachment_path'])
+    if attachment_size > MAX_ATTACHMENT_BYTES:
+        error_msg = f"Attachment exceeds 20MB Freshdesk limit: {attachment_size} bytes"
+        print(f"❌ {error_msg}")
+        logging.error("Attachment exceeds 20MB Freshdesk limit: %d bytes", attachment_size)
+        return None
+
     # Step 1: Create the tracker ticket
     logging.info("Step 1: Creating tracker ticket...")
     print("Step 1: Creating tracker ticket...")
@@ -426,13 +484,13 @@ def create_ticket_with_attachment(ticket_data):
         "cc_emails": ticket_data['cc_emails']
     }
 
-    create_response = requests.post(create_ticket_url, auth=(API_KEY, "X"), headers=headers, json=ticket_payload)
+    body, post_headers = encode_ticket_payload(ticket_payload)
+    create_response = post_body(create_ticket_url, body, post_headers)
 
     if create_response.status_code == 201:
-        tracker_ticket = create_response.json()
-        tracker_ticket_id = tracker_ticket["id"]
+        tracker_ticket_id = int(TICKET_ID_PATTERN.search(create_response.content).group(1))
         print(f"✅ Tracker ticket created successfully! Ticket ID: {tracker_ticket_id}")
-        logging.info(f"Tracker ticket created successfully! Ticket ID: {tracker_ticket_id}")
+        logging.info("Tracker ticket created successfully! Ticket ID: %s", tracker_ticket_id)
     else:
         error_msg = f"Failed to create tracker ticket: {create_response.status_code}, {create_response.text}"
         print(f"❌ {error_msg}")
@@ -443,20 +501,42 @@ def create_ticket_with_attachment(ticket_data):
     logging.info("Step 2: Adding attachment to tracker ticket...")
     print("Step 2: Adding attachment to tracker ticket...")
 
-    update_ticket_url = f"https://{DOMAIN}/api/v2/tickets/{tracker_ticket_id}/notes"
+    update_ticket_url = NOTES_URL % tracker_ticket_id
 
     try:
+        attachment_name = os.path.basename(ticket_data['attachment_path'])
         with open(ticket_data['attachment_path'], "rb") as file:
-            files = {
-                "attachments[]": (os.path.basename(ticket_data['attachment_path']), file, "application/octet-stream"),
-            }
-
-            update_payload = {
-                "body": ticket_data['attachment_note'],
-                "private": "true"
-            }
-
-            update_response = requests.post(update_ticket_url, auth=(API_KEY, "X"), files=files, data=update_payload)
+            if MultipartEncoderMonitor is not None:
+                # Stream the multipart body so large files don't sit in
+                # memory, and report bytes sent as the upload progresses.
+                encoder = MultipartEncoder(fields={
+                    "body": ticket_data['attachment_note'],
+                    "private": "true",
+                    "attachments[]": (attachment_name, file, "application/octet-stream"),
+                })
+                last_reported = [0]
+
+                def report_upload(monitor):
+                    if (monitor.bytes_read - last_reported[0] >= UPLOAD_REPORT_INTERVAL
+                            or monitor.bytes_read == monitor.len):
+                        last_reported[0] = monitor.bytes_read
+                        progress_callback(f"Uploading attachment: {monitor.bytes_read}/{monitor.len} bytes")
+
+                monitor = MultipartEncoderMonitor(encoder, report_upload)
+                update_response = post_body(update_ticket_url, monitor,
+                                            {"Content-Type": monitor.content_type,
+                                             "Content-Length": str(monitor.len)})
+            else:
+                files = {
+                    "attachments[]": (attachment_name, file, "application/octet-stream"),
+                }
+
+                update_payload = {
+                    "body": ticket_data['attachment_note'],
+                    "private": "true"
+                }
+
+                update_response = CLIENT.post(update_ticket_url, files=files, data=update_payload)
 
         if update_response.status_code == 201:
             print("✅ Attachment added successfully to the tracker ticket!")
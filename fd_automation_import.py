@@ -74,15 +74,37 @@ USAGE SCENARIOS:
 - Maintain service level agreements by region
 """
 
+import hashlib
 import requests
 import json
 import logging
+from functools import lru_cache
+
+# httpx serializes the json= payload and sends on a leaner path than
+# requests; fall back to requests when it isn't installed.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson serializes several times faster than the stdlib json module
+# and straight to bytes; fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import os
+import random
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
-api_key = '5TMgbcZdRFY70hSpEdj'
+# Prefer the FD_API_KEY environment variable so the key can be
+# rotated without editing the script
+api_key = os.environ.get('FD_API_KEY', '5TMgbcZdRFY70hSpEdj')
 domain = 'benchmarkeducationcompany.freshdesk.com'
 automation_type_id = 3  # Time-triggered automation type
 
@@ -112,17 +134,23 @@ conditions = [
     }
 ]
 
-# Create the actions for the rule based on region
-actions = []
-for region, group_id in region_to_group.items():
-    actions.append({
-        "field_name": "group_id",
-        "value": group_id,
-        "resource_type": "same_ticket",
-        "custom_fields": {
-            "cf_region": region
-        }
-    })
+# Actions for the rule, one per region. Written out as a literal
+# (rather than rebuilt from region_to_group at import) so the exact
+# payload is reviewable as data; keep in sync with the mapping above.
+actions = [
+    {"field_name": "group_id", "value": 67000578164, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "Central Southeast"}},
+    {"field_name": "group_id", "value": 67000578162, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "Central Southwest"}},
+    {"field_name": "group_id", "value": 67000578163, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "Northeast"}},
+    {"field_name": "group_id", "value": 67000578161, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "West"}},
+    {"field_name": "group_id", "value": 67000578163, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "International"}},
+    {"field_name": "group_id", "value": 67000578163, "resource_type": "same_ticket",
+     "custom_fields": {"cf_region": "DoDEA"}}
+]
 
 # Create the automation rule
 automation_rule = {
@@ -150,24 +178,105 @@ logging.basicConfig(
     ]
 )
 
-# Make the API request to create the rule
-logging.info("Creating automation rule...")
-print("Creating automation rule...")
-url = f'https://{domain}/api/v2/automations/{automation_type_id}/rules'
-headers = {
-    'Content-Type': 'application/json'
-}
-
-response = requests.post(url, auth=(api_key, 'X'), headers=headers, data=json.dumps(automation_rule))
-
-if response.status_code == 201:
-    print("Automation rule created successfully.")
-    logging.info("Automation rule created successfully.")
+# One client for the whole process: the connection stays open between
+# POSTs, so a run that submits several rules pays the TLS handshake
+# only once. The pool is sized for bursts of concurrent rule
+# creations from the GUI.
+if httpx is not None:
+    _CLIENT = httpx.Client(
+        auth=(api_key, 'X'),
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=50))
 else:
-    error_msg = f"Failed to create automation rule. Status Code: {response.status_code}"
-    print(error_msg)
-    print("Response:", response.json())
-    logging.error(error_msg)
+    _CLIENT = requests.Session()
+    _CLIENT.auth = (api_key, 'X')
+    _CLIENT.mount('https://', requests.adapters.HTTPAdapter(
+        pool_connections=10, pool_maxsize=50))
+# Set once: payloads may be sent as pre-serialized bytes, which skips
+# the client's automatic Content-Type handling
+_CLIENT.headers['Content-Type'] = 'application/json'
+
+def _dumps(obj, indent=False):
+    """Serialize obj to a JSON string, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+# Retry policy for transient Freshdesk failures (rate limiting and
+# server errors); anything else is reported to the caller immediately
+MAX_RETRIES = 5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+BACKOFF_CAP = 32  # seconds
+
+# Self-throttling from Freshdesk's rate-limit headers: when
+# X-RateLimit-Remaining runs low the next POST waits instead of
+# burning a round-trip on a guaranteed 429
+RATE_LIMIT_FLOOR = 3
+_next_allowed_ts = 0.0
+
+# One bounded worker pool for rule creations: repeated "Create Rule"
+# clicks queue onto these workers (which share _CLIENT's keep-alive
+# connections) instead of each spawning a fresh thread. Sized to match
+# the client's keep-alive pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=10)
+
+def _post_once(url, payload):
+    """Issue one POST over the shared keep-alive client."""
+    global _next_allowed_ts
+
+    wait = _next_allowed_ts - time.monotonic()
+    if wait > 0:
+        logging.info(f"Rate limit low, waiting {wait:.0f}s before next request")
+        time.sleep(wait)
+
+    # Pre-serialize with orjson when available: the client sends the
+    # bytes as-is instead of running its own json.dumps plus encode
+    if orjson is not None:
+        body_kwargs = {'content' if httpx is not None else 'data':
+                       orjson.dumps(payload)}
+    else:
+        body_kwargs = {'json': payload}
+
+    # 5 s to connect, 30 s for the response: a dead network fails
+    # fast instead of burning the whole read timeout
+    if httpx is not None:
+        response = _CLIENT.post(url, timeout=httpx.Timeout(30, connect=5),
+                                **body_kwargs)
+    else:
+        response = _CLIENT.post(url, timeout=(5, 30), **body_kwargs)
+
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    if response.status_code == 429 or (
+            remaining is not None and int(remaining) <= RATE_LIMIT_FLOOR):
+        _next_allowed_ts = time.monotonic() + int(
+            response.headers.get('Retry-After') or 2)
+
+    return response
+
+def post_rule(url, payload):
+    """POST a rule payload, retrying transient failures with backoff.
+
+    The json= kwarg lets the client serialize and set Content-Type
+    itself instead of a manual json.dumps plus headers dict. On a 429
+    or 5xx the call sleeps min(2**attempt + jitter, BACKOFF_CAP)
+    seconds (honoring Retry-After when present) and tries again, so a
+    blip doesn't force the operator to re-run the whole script.
+    """
+    for attempt in range(MAX_RETRIES):
+        response = _post_once(url, payload)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES - 1:
+            return response
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            wait = int(retry_after)
+        else:
+            wait = min((2 ** attempt) + random.random(), BACKOFF_CAP)
+        logging.warning(
+            f"Got {response.status_code} from Freshdesk, retrying in {wait:.0f}s "
+            f"(attempt {attempt + 1}/{MAX_RETRIES})")
+        time.sleep(wait)
+    return response
 
 def main(rule_config=None, use_gui=False):
     """Main function with optional GUI mode."""
@@ -175,10 +284,7 @@ def main(rule_config=None, use_gui=False):
         rule_config = get_default_rule_config()
 
     if use_gui:
-        def run_rule_creation():
-            process_rule_creation_gui(rule_config)
-
-        threading.Thread(target=run_rule_creation, daemon=True).start()
+        _EXECUTOR.submit(process_rule_creation_gui, rule_config)
         return
 
     # Command-line mode
@@ -265,7 +371,7 @@ def create_gui():
     region_tree.grid(row=0, column=0, columnspan=2, pady=5)
 
     # Load default region mapping
-    for region, group_id in DEFAULT_REGION_MAPPING.items():
+    for region, group_id in _region_mapping.items():
         region_tree.insert("", tk.END, values=(region, group_id))
 
     # Mapping controls
@@ -297,11 +403,11 @@ def create_gui():
                     return
 
                 # Check if region already exists
-                for item in region_tree.get_children():
-                    if region_tree.item(item)["values"][0] == region:
-                        messagebox.showerror("Error", f"Region '{region}' already exists.")
-                        return
+                if region in _region_mapping:
+                    messagebox.showerror("Error", f"Region '{region}' already exists.")
+                    return
 
+                _region_mapping[region] = group_id
                 region_tree.insert("", tk.END, values=(region, group_id))
                 add_window.destroy()
             except ValueError:
@@ -315,15 +421,18 @@ def create_gui():
             messagebox.showerror("Error", "Please select a mapping to remove.")
             return
 
+        _region_mapping.pop(region_tree.item(selection[0])["values"][0], None)
         region_tree.delete(selection[0])
 
     def clear_mappings():
+        _region_mapping.clear()
         for item in region_tree.get_children():
             region_tree.delete(item)
 
     def load_defaults():
         clear_mappings()
-        for region, group_id in DEFAULT_REGION_MAPPING.items():
+        _region_mapping.update(DEFAULT_REGION_MAPPING)
+        for region, group_id in _region_mapping.items():
             region_tree.insert("", tk.END, values=(region, group_id))
 
     ttk.Button(control_frame, text="Add", command=add_mapping).grid(row=0, column=0, padx=5)
@@ -339,7 +448,7 @@ def create_gui():
     ttk.Label(config_frame, text="Conditions (JSON):").grid(row=0, column=0, sticky=tk.W, pady=5)
     conditions_text = scrolledtext.ScrolledText(config_frame, height=4, width=60)
     conditions_text.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5)
-    conditions_text.insert('1.0', json.dumps(DEFAULT_CONDITIONS, indent=2))
+    conditions_text.insert('1.0', DEFAULT_CONDITIONS_JSON)
 
     # Actions
     ttk.Label(config_frame, text="Actions (JSON):").grid(row=1, column=0, sticky=tk.W, pady=5)
@@ -349,24 +458,20 @@ def create_gui():
     def update_actions():
         """Update actions based on current region mapping."""
         try:
-            region_mapping = {}
-            for item in region_tree.get_children():
-                values = region_tree.item(item)["values"]
-                region_mapping[values[0]] = values[1]
-
-            actions = []
-            for region, group_id in region_mapping.items():
-                actions.append({
+            # _region_mapping is kept in sync with the Treeview, so no
+            # per-item Tk round-trips are needed here
+            actions = [
+                {
                     "field_name": "group_id",
                     "value": group_id,
                     "resource_type": "same_ticket",
-                    "custom_fields": {
-                        "cf_region": region
-                    }
-                })
+                    "custom_fields": {"cf_region": region}
+                }
+                for region, group_id in _region_mapping.items()
+            ]
 
             actions_text.delete('1.0', tk.END)
-            actions_text.insert('1.0', json.dumps(actions, indent=2))
+            actions_text.insert('1.0', _dumps(actions, indent=True))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update actions: {str(e)}")
 
@@ -376,12 +481,6 @@ def create_gui():
 
     def preview_rule():
         try:
-            # Get current configuration
-            region_mapping = {}
-            for item in region_tree.get_children():
-                values = region_tree.item(item)["values"]
-                region_mapping[values[0]] = values[1]
-
             conditions = json.loads(conditions_text.get('1.0', tk.END).strip())
             actions = json.loads(actions_text.get('1.0', tk.END).strip())
 
@@ -397,7 +496,7 @@ def create_gui():
             preview_text = "Rule Preview:\n\n"
             preview_text += f"Name: {rule_config['name']}\n"
             preview_text += f"Type: {rule_config['automation_type_id']}\n"
-            preview_text += f"Regions: {len(region_mapping)}\n"
+            preview_text += f"Regions: {len(_region_mapping)}\n"
             preview_text += f"Actions: {len(actions)}\n"
 
             messagebox.showinfo("Rule Preview", preview_text)
@@ -411,16 +510,10 @@ def create_gui():
                 messagebox.showerror("Error", "Please enter a rule name.")
                 return
 
-            if region_tree.get_children() == ():
+            if not _region_mapping:
                 messagebox.showerror("Error", "Please add at least one region mapping.")
                 return
 
-            # Get current configuration
-            region_mapping = {}
-            for item in region_tree.get_children():
-                values = region_tree.item(item)["values"]
-                region_mapping[values[0]] = values[1]
-
             conditions = json.loads(conditions_text.get('1.0', tk.END).strip())
             actions = json.loads(actions_text.get('1.0', tk.END).strip())
 
@@ -433,7 +526,7 @@ def create_gui():
                 "actions": actions
             }
 
-            threading.Thread(target=process_rule_creation_gui, args=(rule_config,), daemon=True).start()
+            _EXECUTOR.submit(process_rule_creation_gui, rule_config)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create rule configuration: {str(e)}")
@@ -443,12 +536,13 @@ def create_gui():
         automation_type_var.set("3")
         load_defaults_mapping()
         conditions_text.delete('1.0', tk.END)
-        conditions_text.insert('1.0', json.dumps(DEFAULT_CONDITIONS, indent=2))
+        conditions_text.insert('1.0', DEFAULT_CONDITIONS_JSON)
         update_actions()
 
     def load_defaults_mapping():
         clear_mappings()
-        for region, group_id in DEFAULT_REGION_MAPPING.items():
+        _region_mapping.update(DEFAULT_REGION_MAPPING)
+        for region, group_id in _region_mapping.items():
             region_tree.insert("", tk.END, values=(region, group_id))
 
     ttk.Button(button_frame, text="Preview Rule", command=preview_rule).grid(row=0, column=0, padx=5)
@@ -465,19 +559,36 @@ def create_gui():
 
     return app
 
+# Hashes of rule configs already accepted this run, so a repeated
+# "Create Rule" click skips the round-trip instead of posting a
+# duplicate rule
+_submitted = set()
+
+def _rule_key(rule_config):
+    """Stable digest of a rule config (key order doesn't matter)."""
+    if orjson is not None:
+        canonical = orjson.dumps(rule_config, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(rule_config, sort_keys=True).encode()
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
 def create_automation_rule(rule_config):
     """Create automation rule - refactored to accept configuration."""
+    key = _rule_key(rule_config)
+    if key in _submitted:
+        logging.info("Identical rule already submitted this run; skipping POST")
+        print("Identical rule already submitted this run; skipping.")
+        return True
+
     logging.info("Creating automation rule...")
     print("Creating automation rule...")
 
     url = f'https://{domain}/api/v2/automations/{rule_config["automation_type_id"]}/rules'
-    headers = {
-        'Content-Type': 'application/json'
-    }
 
-    response = requests.post(url, auth=(api_key, 'X'), headers=headers, data=json.dumps(rule_config))
+    response = post_rule(url, rule_config)
 
     if response.status_code == 201:
+        _submitted.add(key)
         print("Automation rule created successfully.")
         logging.info("Automation rule created successfully.")
         return True
@@ -488,8 +599,9 @@ def create_automation_rule(rule_config):
         logging.error(error_msg)
         return False
 
+@lru_cache(maxsize=1)
 def get_default_rule_config():
-    """Get default rule configuration."""
+    """Get default rule configuration (built once, then cached)."""
     return {
         "name": "Assign Unassigned Tickets Based on Region at 8 AM",
         "automation_type_id": 3,
@@ -499,31 +611,36 @@ def get_default_rule_config():
         "actions": get_default_actions()
     }
 
+@lru_cache(maxsize=1)
 def get_default_actions():
-    """Get default actions based on region mapping."""
-    actions = []
-    for region, group_id in DEFAULT_REGION_MAPPING.items():
-        actions.append({
+    """Get default actions based on region mapping (built once, then cached)."""
+    return [
+        {
             "field_name": "group_id",
             "value": group_id,
             "resource_type": "same_ticket",
-            "custom_fields": {
-                "cf_region": region
-            }
-        })
-    return actions
+            "custom_fields": {"cf_region": region}
+        }
+        for region, group_id in DEFAULT_REGION_MAPPING.items()
+    ]
 
-# Default configurations
-DEFAULT_REGION_MAPPING = {
+# Default configurations, frozen so no handler can mutate them by
+# accident (edits belong in _region_mapping / the GUI text areas)
+DEFAULT_REGION_MAPPING = MappingProxyType({
     "Central Southeast": 67000578164,
     "Central Southwest": 67000578162,
     "Northeast": 67000578163,
     "West": 67000578161,
     "International": 67000578163,
     "DoDEA": 67000578163
-}
+})
+
+# Python-side mirror of the GUI's region Treeview, maintained by the
+# add/remove/clear handlers: reading it is a dict lookup, while each
+# Treeview item access is a Tk/Tcl bridge round-trip
+_region_mapping = dict(DEFAULT_REGION_MAPPING)
 
-DEFAULT_CONDITIONS = [
+DEFAULT_CONDITIONS = (
     {
         "resource_type": "ticket",
         "field_name": "status",
@@ -536,7 +653,11 @@ DEFAULT_CONDITIONS = [
         "operator": "greater_than",
         "value": 0  # This ensures it includes tickets from any time within the last day
     }
-]
+)
+
+# Serialized once so each GUI "Load Defaults" click is an insert, not
+# a re-serialization
+DEFAULT_CONDITIONS_JSON = _dumps(DEFAULT_CONDITIONS, indent=True)
 
 # Run GUI if --gui flag is passed, otherwise run command line mode
 if __name__ == "__main__":
@@ -94,20 +94,31 @@ import time
 import tkinter as tk
 from tkinter import scrolledtext, filedialog, messagebox
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Freshdesk API Configuration
 # TODO: Move these to environment variables for security
 API_KEY = '5TMgbcZdRFY70hSpEdj'  # Replace with your actual API key
 DOMAIN = 'benchmarkeducationcompany.freshdesk.com'  # Replace with your domain
 
-# Authentication and headers
-auth = (API_KEY, 'X')
-headers = {'Content-Type': 'application/json'}
+# One session for all API calls: auth and headers are set once, and
+# the urllib3 pool keeps connections open so concurrent page fetches
+# and long PUT runs reuse sockets instead of handshaking per request
+SESSION = requests.Session()
+SESSION.auth = (API_KEY, 'X')
+SESSION.headers.update({'Content-Type': 'application/json'})
+SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=10, pool_maxsize=50))
 
 # Rate limiting configuration (Enterprise plan)
 RATE_LIMIT = 700  # Enterprise plan rate limit
 RATE_LIMIT_WINDOW = 60  # in seconds
 
+# Pagination configuration
+CONTACTS_PER_PAGE = 100  # Maximum page size the API allows
+CONCURRENT_PAGE_FETCHES = 10  # Pages fetched in parallel per wave
+SEARCH_MAX_PAGES = 10  # Search API caps results at 10 pages of 30
+
 # Initialize rate limit tracking
 rate_limit_remaining = RATE_LIMIT
 rate_limit_reset_time = time.time() + RATE_LIMIT_WINDOW
@@ -149,19 +160,27 @@ def make_request(method, endpoint, params=None, data=None):
     # Construct full URL
     url = f'https://{DOMAIN}/api/v2{endpoint}'
 
-    # Make the API request
-    response = requests.request(
-        method,
-        url,
-        headers=headers,
-        params=params,
-        json=data,
-        auth=auth
-    )
+    # Make the API request, retrying iteratively on 429. Freshdesk's
+    # Retry-After header is often only a few seconds, so honoring it
+    # beats any fixed wait; the loop keeps the call stack flat.
+    while True:
+        response = SESSION.request(
+            method,
+            url,
+            params=params,
+            json=data
+        )
+
+        # Update rate limit counters from response headers
+        rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', RATE_LIMIT))
+        rate_limit_reset_time = time.time() + RATE_LIMIT_WINDOW
+
+        if response.status_code != 429:
+            break
 
-    # Update rate limit counters from response headers
-    rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', RATE_LIMIT))
-    rate_limit_reset_time = time.time() + RATE_LIMIT_WINDOW
+        retry_after = int(response.headers.get('Retry-After', RATE_LIMIT_WINDOW))
+        print(f"Rate limit hit. Waiting {retry_after} seconds...")
+        time.sleep(retry_after)
 
     # Raise exception for HTTP errors (4xx, 5xx)
     response.raise_for_status()
@@ -186,21 +205,88 @@ def get_contacts_by_company(company_id):
         - Handles pagination automatically
         - Returns empty list if company has no contacts or doesn't exist
     """
+    def fetch_page(page):
+        return make_request(
+            'GET',
+            f'/contacts?company_id={company_id}&page={page}&per_page={CONTACTS_PER_PAGE}'
+        )
+
+    # Fetch page 1 first to learn whether pagination is needed at all
+    contacts = fetch_page(1) or []
+
+    if len(contacts) < CONTACTS_PER_PAGE:
+        return contacts
+
+    # Fetch remaining pages in concurrent waves instead of one at a time.
+    # Freshdesk doesn't tell us the last page up front, so each wave of
+    # CONCURRENT_PAGE_FETCHES pages runs in parallel and we stop at the
+    # first short or empty page.
+    next_page = 2
+    with ThreadPoolExecutor(max_workers=CONCURRENT_PAGE_FETCHES) as executor:
+        while True:
+            pages = range(next_page, next_page + CONCURRENT_PAGE_FETCHES)
+            results = list(executor.map(fetch_page, pages))
+
+            done = False
+            for result in results:
+                if not result:
+                    done = True
+                    break
+                contacts.extend(result)
+                if len(result) < CONTACTS_PER_PAGE:
+                    done = True
+                    break
+
+            if done:
+                break
+            next_page += CONCURRENT_PAGE_FETCHES
+
+    return contacts
+
+def search_contacts_by_domain(domain, company_id=None):
+    """
+    Search for contacts whose email matches a domain, server-side.
+
+    Uses the Freshdesk search API so only matching contacts are
+    transferred, instead of downloading every contact and filtering
+    in Python.
+
+    Args:
+        domain (str): Email domain to match (e.g., 'example.com')
+        company_id (int, optional): If given, only keep contacts
+                                    belonging to this company
+
+    Returns:
+        list: List of matching contact dictionaries
+
+    Note:
+        - The search API returns 30 results per page, max 10 pages
+        - Results are filtered by company_id client-side since the
+          query string only supports the email condition
+    """
     contacts = []
     page = 1
 
-    while True:
-        # Fetch contacts for this company, one page at a time
-        response = make_request('GET', f'/contacts?company_id={company_id}&page={page}')
+    while page <= SEARCH_MAX_PAGES:
+        response = make_request(
+            'GET',
+            '/search/contacts',
+            params={'query': f'"email:\'*{domain}\'"', 'page': page}
+        )
 
-        if not response:
-            # No more contacts or error occurred
+        if not response or not response.get('results'):
             break
 
-        # Add this page of contacts to our collection
-        contacts.extend(response)
+        contacts.extend(response['results'])
+
+        # Stop once every match has been collected
+        if len(contacts) >= response.get('total', 0):
+            break
         page += 1
 
+    if company_id is not None:
+        contacts = [c for c in contacts if c.get('company_id') == company_id]
+
     return contacts
 
 def update_company_domains(company_id, domains):
@@ -280,10 +366,11 @@ def move_contacts_and_domain(source_company_id, incorrect_domain, correct_compan
     log.insert(tk.END, f'Delete source company: {delete_company_flag}\n\n')
 
     try:
-        # Step 1: Get all contacts from source company
-        log.insert(tk.END, 'Step 1: Fetching contacts from source company...\n')
-        source_company_contacts = get_contacts_by_company(source_company_id)
-        log.insert(tk.END, f'Found {len(source_company_contacts)} contacts in source company.\n')
+        # Step 1: Search for contacts with the domain (server-side filter,
+        # avoids downloading every contact in the source company)
+        log.insert(tk.END, 'Step 1: Searching for contacts with the domain...\n')
+        matching_contacts = search_contacts_by_domain(incorrect_domain, company_id=source_company_id)
+        log.insert(tk.END, f'Found {len(matching_contacts)} matching contacts in source company.\n')
 
         # Step 2: Remove domain from source company
         log.insert(tk.END, 'Step 2: Removing domain from source company...\n')
@@ -315,10 +402,7 @@ def move_contacts_and_domain(source_company_id, incorrect_domain, correct_compan
 
         # Step 4: Move contacts with the domain
         log.insert(tk.END, 'Step 4: Moving contacts...\n')
-        contact_ids_to_move = [
-            contact['id'] for contact in source_company_contacts
-            if incorrect_domain in contact['email']
-        ]
+        contact_ids_to_move = [contact['id'] for contact in matching_contacts]
 
         if contact_ids_to_move:
             move_contacts_to_company(contact_ids_to_move, correct_company_id)
@@ -377,25 +461,27 @@ def move_only_contacts(source_company_id, target_company_id, delete_source_flag,
     log.insert(tk.END, f'Delete source company: {delete_source_flag}\n\n')
 
     try:
-        # Step 1: Get all contacts from source company
-        log.insert(tk.END, 'Step 1: Fetching contacts from source company...\n')
-        source_company_contacts = get_contacts_by_company(company_id=source_company_id)
-        log.insert(tk.END, f'Found {len(source_company_contacts)} contacts in source company.\n')
-
-        # Step 2: Filter contacts based on criteria
-        log.insert(tk.END, 'Step 2: Filtering contacts...\n')
-
+        # Steps 1-2: Collect the contacts to move
         if move_all_flag:
-            # Move all contacts
+            # Moving everything, so the full company listing is needed
+            log.insert(tk.END, 'Step 1: Fetching contacts from source company...\n')
+            source_company_contacts = get_contacts_by_company(company_id=source_company_id)
+            log.insert(tk.END, f'Found {len(source_company_contacts)} contacts in source company.\n')
+
+            log.insert(tk.END, 'Step 2: Filtering contacts...\n')
             contact_ids_to_move = [contact['id'] for contact in source_company_contacts]
             log.insert(tk.END, f'Moving all {len(contact_ids_to_move)} contacts.\n')
         else:
-            # Filter by specific domains
+            # Search server-side per domain rather than downloading and
+            # filtering the whole company
+            log.insert(tk.END, 'Step 1: Searching for contacts by domain...\n')
             domain_list = [domain.strip().lower() for domain in domains_to_move.split(',') if domain.strip()]
-            contact_ids_to_move = [
-                contact['id'] for contact in source_company_contacts
-                if any(domain in contact['email'].lower() for domain in domain_list)
-            ]
+            matching_contacts = []
+            for domain in domain_list:
+                matching_contacts.extend(search_contacts_by_domain(domain, company_id=source_company_id))
+
+            log.insert(tk.END, 'Step 2: Filtering contacts...\n')
+            contact_ids_to_move = list(dict.fromkeys(contact['id'] for contact in matching_contacts))
             log.insert(tk.END, f'Found {len(contact_ids_to_move)} contacts matching domains: {domains_to_move}\n')
 
         if not contact_ids_to_move:
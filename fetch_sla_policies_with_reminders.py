@@ -105,7 +105,16 @@ DOMAIN = 'benchmarkeducationcompany.freshdesk.com'  # Replace with your domain
 
 # API Configuration
 BASE_URL = f'https://{DOMAIN}/api/v2'
-HEADERS = {'Content-Type': 'application/json'}
+
+# Shared session: keeps one TCP+TLS connection alive across the
+# paginated walk and asks for gzip so the text-heavy SLA payloads
+# arrive compressed (requests decompresses transparently).
+SESSION = requests.Session()
+SESSION.auth = (API_KEY, 'X')
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'Accept-Encoding': 'gzip'
+})
 
 # Output configuration
 OUTPUT_FILENAME = 'sla_policies_with_reminders.xlsx'  # Default output filename
@@ -169,16 +178,11 @@ def get_sla_policies():
     page = 1
 
     logging.info(f"Starting SLA policies retrieval from {DOMAIN} for reminder analysis")
-    print("Fetching SLA policies for reminder analysis..."
+    print("Fetching SLA policies for reminder analysis...")
     while True:
         try:
             # Make API request for current page
-            response = requests.get(
-                endpoint,
-                headers=HEADERS,
-                auth=(API_KEY, 'X'),
-                params={'page': page}
-            )
+            response = SESSION.get(endpoint, params={'page': page})
 
             if response.status_code == 200:
                 # Success - parse response data
@@ -344,7 +348,7 @@ def save_to_excel(data, file_name):
     """
     try:
         logging.info(f"Preparing {len(data)} SLA policies for Excel export with reminder analysis...")
-        print("Preparing data for Excel export..."
+        print("Preparing data for Excel export...")
         # Apply reminder analysis and flattening
         enriched_data = []
         for policy in data: